@@ -1,22 +1,28 @@
 """CLI entry point for pdf-burger.
 
-Monadic pipeline: parse -> collect -> resolve -> merge.
-All logic is pure; side effects are deferred in IO and
-only executed at the boundary (main).
+Pipeline: parse -> resolve output -> collect -> merge.
+Each step returns a Result; _run_pipeline runs them in sequence,
+stops at the first Err, and turns the outcome into an exit code.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pdf_burger import __version__
-from pdf_burger.collector import CollectResult, collect_pdfs
-from pdf_burger.console import Console, create_console
-from pdf_burger.merger import MergeResult, merge_pdfs
-from pdf_burger.monads import Err, IO, Ok, Result, pipe
+from pdf_burger.monads import Err, Ok, Result
+
+# collector, console and merger are imported where they are first needed,
+# so --help, --version and usage errors never load rich or pypdf.
+if TYPE_CHECKING:
+    from pdf_burger.console import Console
+    from pdf_burger.merger import MergeResult
 
 
 # ── Immutable config parsed from argv ──────────────────────────────
@@ -27,6 +33,7 @@ class Config:
     inputs: tuple[str, ...]
     output: str | None
     recursive: bool
+    skip_hidden: bool
     overwrite: bool
     verbose: bool
     dry_run: bool
@@ -46,6 +53,7 @@ def parse_config(argv: list[str] | None) -> Result[Config, str]:
         inputs=tuple(args.inputs),
         output=args.output,
         recursive=args.recursive,
+        skip_hidden=args.skip_hidden,
         overwrite=args.overwrite,
         verbose=args.verbose,
         dry_run=args.dry_run,
@@ -56,10 +64,11 @@ def resolve_output(output_arg: str | None, inputs: tuple[str, ...]) -> Path:
     """Determine output path. Pure."""
     if output_arg is not None:
         return Path(output_arg)
+    cwd = Path.cwd()
     candidate = (
-        Path.cwd() / f"{Path(inputs[0]).name}.pdf"
+        cwd / f"{Path(inputs[0]).name}.pdf"
         if len(inputs) == 1 and Path(inputs[0]).is_dir()
-        else Path.cwd() / "merged.pdf"
+        else cwd / "merged.pdf"
     )
     return _unique_path(candidate)
 
@@ -67,13 +76,16 @@ def resolve_output(output_arg: str | None, inputs: tuple[str, ...]) -> Path:
 def _unique_path(path: Path) -> Path:
     if not path.exists():
         return path
-    return next(
-        (
-            c for i in range(1, 1000)
-            if not (c := path.parent / f"{path.stem}_{i:03d}{path.suffix}").exists()
-        ),
-        path,
-    )
+    # One directory listing rules out taken names instead of a stat() each.
+    # Names are casefolded for case-insensitive filesystems, and the pick is
+    # confirmed with one exists() for lookups the listing cannot model.
+    with os.scandir(path.parent) as it:
+        existing = {entry.name.casefold() for entry in it}
+    for i in range(1, 1000):
+        name = f"{path.stem}_{i:03d}{path.suffix}"
+        if name.casefold() not in existing and not (path.parent / name).exists():
+            return path.parent / name
+    return path
 
 
 def check_overwrite(output: Path, config: Config) -> Result[Path, str]:
@@ -95,114 +107,61 @@ def format_result(result: MergeResult) -> str:
     return f"merged {result.file_count} PDFs ({result.page_count} pages) -> {result.output.name}"
 
 
-# ── Monadic pipeline ───────────────────────────────────────────────
+# ── Pipeline ───────────────────────────────────────────────────────
 
 
-def _build_pipeline(
-    config: Config,
-    con: Console,
-) -> IO[Result[int, str]]:
-    """Compose the full merge pipeline monadically.
-
-    collect_pdfs -> check_overwrite -> (dry_run | merge) -> format
-    """
-    collected: Result[CollectResult, str] = collect_pdfs(
-        list(config.inputs), recursive=config.recursive,
+def _run_pipeline(config: Config, con: Console) -> int:
+    """Run the pipeline step by step and interpret each Result into an exit code."""
+    # Checked before collecting so a blocked run never touches the inputs.
+    checked = check_overwrite(resolve_output(config.output, config.inputs), config)
+    if checked.is_err():
+        con.error(checked.error)
+        return 1
+    output = checked.value
+
+    from pdf_burger.collector import collect_pdfs
+
+    collected = collect_pdfs(
+        list(config.inputs),
+        recursive=config.recursive,
+        validate=not config.dry_run,
+        skip_hidden=config.skip_hidden,
     )
+    if collected.is_err():
+        con.error(collected.error)
+        return 1
+    cr = collected.value
 
-    def emit_warnings_and_continue(cr: CollectResult) -> Result[CollectResult, str]:
-        for w in cr.warnings:
-            con.warning(w)
-        return Ok(cr)
-
-    def to_exit_code(cr: CollectResult) -> IO[Result[int, str]]:
-        output = resolve_output(config.output, config.inputs)
-
-        return pipe(
-            check_overwrite(output, config),
-            lambda r: r.bind(lambda out: _dispatch(cr.files, out, config, con)),
-        )
-
-    def _dispatch(
-        files: tuple[Path, ...],
-        output: Path,
-        cfg: Config,
-        con: Console,
-    ) -> Result[int, str]:
-        if cfg.dry_run:
-            con.info(format_dry_run(files))
-            return Ok(0)
-
-        merge_io: IO[Result[MergeResult, str]] = merge_pdfs(
-            files, output, on_verbose=con.verbose, rich_console=con.rich,
-        )
-        merge_result = merge_io.run()
-
-        match merge_result:
-            case Ok(result):
-                con.success(format_result(result))
-                con.verbose(f"  output: {result.output}")
-                return Ok(0)
-            case Err(e):
-                return Err(e)
-
-    result: Result[int, str] = (
-        collected
-        .bind(emit_warnings_and_continue)
-        .bind(lambda cr: to_exit_code(cr))
-        # to_exit_code returns IO[Result], but we need to unwrap
-    )
+    for w in cr.warnings:
+        con.warning(w)
 
-    # Flatten: if collected failed, wrap in IO; otherwise already executed
-    match result:
-        case Ok(io_result) if isinstance(io_result, IO):
-            return io_result
-        case _:
-            return IO.pure(result)
+    if config.dry_run:
+        con.info(format_dry_run(cr.files))
+        return 0
 
+    # Deferred so --dry-run never loads pypdf's writer.
+    from pdf_burger.merger import merge_pdfs
 
-def _run_pipeline(config: Config, con: Console) -> int:
-    """Execute the monadic pipeline and interpret the Result into an exit code."""
-    collected = collect_pdfs(list(config.inputs), recursive=config.recursive)
-
-    match collected:
-        case Err(msg):
-            con.error(msg)
-            return 1
-        case Ok(cr):
-            for w in cr.warnings:
-                con.warning(w)
-
-            output = resolve_output(config.output, config.inputs)
-
-            match check_overwrite(output, config):
-                case Err(msg):
-                    con.error(msg)
-                    return 1
-                case Ok(out):
-                    if config.dry_run:
-                        con.info(format_dry_run(cr.files))
-                        return 0
-
-                    merge_io = merge_pdfs(
-                        cr.files, out,
-                        on_verbose=con.verbose, rich_console=con.rich,
-                    )
-
-                    match merge_io.run():
-                        case Ok(result):
-                            con.success(format_result(result))
-                            con.verbose(f"  output: {result.output}")
-                            return 0
-                        case Err(msg):
-                            con.error(msg)
-                            return 1
+    merged = merge_pdfs(
+        cr.files, output,
+        on_verbose=con.verbose, rich_console=con.rich,
+        skippable=cr.skippable, on_warning=con.warning,
+    ).run()
+    if merged.is_err():
+        con.error(merged.error)
+        return 1
+
+    con.success(format_result(merged.value))
+    con.verbose(f"  output: {merged.value.output}")
+    return 0
 
 
 # ── Argument parser ────────────────────────────────────────────────
 
 
+@cache
 def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args never mutates it."""
     parser = argparse.ArgumentParser(
         prog="pdf-burger",
         description="Stack multiple PDFs and directories into a single file.",
@@ -218,6 +177,7 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("inputs", nargs="+", help="PDF files or directories to merge")
     parser.add_argument("-o", "--output", default=None, help="output file path (default: merged.pdf)")
     parser.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    parser.add_argument("--skip-hidden", action="store_true", help="with -r, skip hidden directories and __pycache__")
     parser.add_argument("--overwrite", action="store_true", help="allow overwriting an existing output file")
     parser.add_argument("--verbose", action="store_true", help="show detailed log")
     parser.add_argument("--dry-run", action="store_true", help="list target files without merging")
@@ -228,8 +188,14 @@ def _build_parser() -> argparse.ArgumentParser:
 # ── Side-effect boundary (the only impure entry point) ─────────────
 
 
+def _create_console(verbose: bool = False) -> Console:
+    from pdf_burger.console import create_console
+
+    return create_console(verbose=verbose)
+
+
 def main(argv: list[str] | None = None) -> int:
-    """The single impure entry point. Interprets the monadic pipeline."""
+    """The single impure entry point. Parses argv and runs the pipeline."""
     try:
         match parse_config(argv):
             case Err(msg) if msg == "__exit__0":
@@ -237,13 +203,13 @@ def main(argv: list[str] | None = None) -> int:
             case Err(msg) if msg.startswith("__exit__"):
                 return 2
             case Err(msg):
-                create_console().error(msg)
+                _create_console().error(msg)
                 return 2
             case Ok(config):
-                con = create_console(verbose=config.verbose)
+                con = _create_console(verbose=config.verbose)
                 return _run_pipeline(config, con)
     except KeyboardInterrupt:
-        create_console().error("interrupted")
+        _create_console().error("interrupted")
         return 130
 
 
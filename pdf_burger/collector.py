@@ -6,116 +6,379 @@ Warnings are accumulated as data (Writer-like pattern), not as side effects.
 
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass
-from functools import partial, reduce
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cache, lru_cache, partial
+from itertools import product
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pypdf import PdfReader
+from pdf_burger.monads import Err, Ok, Result, safe
 
-from pdf_burger.monads import Err, Ok, Result, partition_results, safe
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+# Bytes read from each end of a file when probing for the %PDF- header
+# and the %%EOF marker. Readers accept junk before the header within 1 KiB.
+_PROBE_SIZE = 1024
+
+# Every casing of ".pdf": one slice and a set lookup per directory entry,
+# with no lower() call or fnmatch pattern.
+_PDF_SUFFIXES = frozenset(map("".join, product(".", "pP", "dD", "fF")))
+
+# Probe threads mostly wait on open()/read(), so oversubscribe the CPUs;
+# the cap keeps a huge directory from spawning hundreds of threads.
+_MAX_PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 @dataclass(frozen=True)
 class CollectResult:
-    """Immutable collection result carrying both files and warnings."""
+    """Immutable collection result carrying both files and warnings.
+
+    skippable holds the files found in directories: the probe only checks
+    their header and trailer, so one that still fails to parse when
+    merging is dropped with a warning rather than aborting the merge.
+    """
     files: tuple[Path, ...]
     warnings: tuple[str, ...]
+    skippable: frozenset[Path] = frozenset()
 
 
-def natural_sort_key(path: Path) -> list:
-    """Sort key for natural ordering (1, 2, 10 instead of 1, 10, 2)."""
-    parts = re.split(r"(\d+)", path.name)
-    return [int(p) if p.isdigit() else p.lower() for p in parts]
+@dataclass(frozen=True)
+class _Candidate:
+    """A collected path awaiting validation.
+
+    source is the CLI argument for explicit files, whose failures are fatal;
+    it is None for files found in a directory, whose failures only warn.
+    root is the walked directory for files found in one, and linked marks
+    a file that is itself a symlink; _dedupe uses both to build keys.
+    """
+    path: Path
+    source: str | None
+    root: str | None = None
+    linked: bool = False
+
+
+@dataclass(frozen=True)
+class _Found:
+    """What one input contributed during the gathering pass."""
+    candidates: tuple[_Candidate, ...]
+    warnings: tuple[str, ...]
+    # Whether a walk met a symlinked file, the only way one input can
+    # yield the same file twice.
+    linked: bool = False
+
+
+_SPLIT_NUMBERS = re.compile(r"([0-9]+)").split
+
+
+def _number_key(digits: str) -> tuple[int, str]:
+    """Order a digit run by value without int(): shorter wins, then lexically.
+
+    int() is superlinear on long runs and refuses more than 4300 digits;
+    this stays linear and still treats "007" and "7" as equal.
+    """
+    digits = digits.lstrip("0")
+    return len(digits), digits
+
+
+@lru_cache(maxsize=4096)
+def _name_key(name: str) -> tuple:
+    # split() with a capture group alternates text, digits, text, ...; the
+    # digit runs sit at odd indices, so no per-part isdigit() test is needed.
+    parts = _SPLIT_NUMBERS(name.lower())
+    parts[1::2] = map(_number_key, parts[1::2])
+    return tuple(parts)
+
+
+def natural_sort_key(path: Path | str) -> tuple:
+    """Sort key for natural ordering (1, 2, 10 instead of 1, 10, 2).
+
+    Takes a Path (keyed on its name) or a bare file name string such as
+    DirEntry.name, which is used as-is.
+    """
+    return _name_key(path if isinstance(path, str) else path.name)
+
+
+@cache
+def _pdf_reader() -> type[PdfReader]:
+    """Import pypdf on first use only; it is slow to import and listing never needs it."""
+    from pypdf import PdfReader
+
+    return PdfReader
 
 
 @safe
 def _read_pdf(path: Path) -> Path:
     """Try to read a PDF. Returns Ok(path) or Err(exception)."""
-    reader = PdfReader(str(path))
+    reader = _pdf_reader()(os.fspath(path))
     if len(reader.pages) == 0:
         raise ValueError(f"PDF has no pages: {path}")
     return path
 
 
-def validate_pdf(path: Path) -> Result[Path, str]:
-    """Validate a PDF is readable. Returns Ok(path) or Err(message)."""
-    return _read_pdf(path).map_err(lambda e: str(e))
+@safe
+def _probe_pdf(path: Path) -> Path:
+    """Cheap structural check: %PDF- header near the start, %%EOF near the end.
+
+    Uses raw os.read on a descriptor: two 1 KiB reads need neither a
+    buffered file object nor its 8 KiB buffer. Readers search the whole
+    file for %%EOF, so when it is not in the last 1 KiB (trailing padding
+    or appended junk) a full parse decides instead.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if b"%PDF-" not in os.read(fd, _PROBE_SIZE):
+            raise ValueError(f"missing %PDF- header: {path}")
+        size = os.lseek(fd, 0, os.SEEK_END)
+        os.lseek(fd, max(size - _PROBE_SIZE, 0), os.SEEK_SET)
+        if b"%%EOF" in os.read(fd, _PROBE_SIZE):
+            return path
+    finally:
+        os.close(fd)
+
+    match _read_pdf(path):
+        case Ok():
+            return path
+        case Err(e):
+            raise ValueError(f"missing %%EOF marker: {path} ({e})")
+
 
+def validate_pdf(path: Path, deep: bool = False) -> Result[Path, str]:
+    """Validate a PDF is readable. Returns Ok(path) or Err(message).
 
-def _resolve_file(raw: str, path: Path) -> Result[CollectResult, str]:
+    By default only the header and trailer marker are probed (with a full
+    parse if the marker is not near the end); anything subtler surfaces
+    when merging. deep=True always does a full pypdf parse.
+    """
+    check = _read_pdf if deep else _probe_pdf
+    return check(path).map_err(lambda e: str(e))
+
+
+def _resolve_file(raw: str, path: Path) -> Result[_Found, str]:
     """Resolve an explicit file path. Errors are fatal (Err)."""
     if path.suffix.lower() != ".pdf":
         return Err(f"not a PDF file: {raw}")
-    return validate_pdf(path).map(
-        lambda p: CollectResult(files=(p,), warnings=())
-    ).map_err(lambda e: f"cannot read PDF: {raw} ({e})")
-
-
-def _resolve_dir(raw: str, path: Path, recursive: bool) -> Result[CollectResult, str]:
-    """Resolve a directory. Corrupt PDFs become warnings, not errors."""
-    glob_fn = path.rglob if recursive else path.glob
-    pdfs = sorted(
-        (p for p in glob_fn("*.[pP][dD][fF]") if p.is_file()),
-        key=natural_sort_key,
-    )
-
-    if not pdfs:
-        return Ok(CollectResult(
-            files=(),
-            warnings=(f"no PDFs found in directory: {raw}",),
-        ))
+    return Ok(_Found(candidates=(_Candidate(path, raw),), warnings=()))
 
-    validated = list(map(validate_pdf, pdfs))
-    valid_paths, errors = partition_results(validated)
 
-    return Ok(CollectResult(
-        files=tuple(valid_paths),
-        warnings=tuple(errors),
+def _is_pruned(dirname: str) -> bool:
+    """Directories a recursive walk never enters: hidden ones and __pycache__."""
+    return dirname.startswith(".") or dirname == "__pycache__"
+
+
+def _scandir_pdfs(
+    root: str,
+    recursive: bool,
+    skip_hidden: bool,
+) -> tuple[list[os.DirEntry[str]], list[str]]:
+    """Collect DirEntry objects for PDF files under root using os.scandir.
+
+    Walks with an explicit stack instead of recursion. DirEntry caches the
+    file type, so filtering costs no extra stat() per entry. Symlinked
+    directories are not descended into (same as Path.rglob); with
+    skip_hidden, neither are hidden ones or __pycache__. A subdirectory that
+    cannot be read is skipped with a warning; an unreadable root raises
+    OSError.
+    """
+    found: list[os.DirEntry[str]] = []
+    warnings: list[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.name[-4:] in _PDF_SUFFIXES and entry.is_file():
+                        found.append(entry)
+                    elif (
+                        recursive
+                        and not (skip_hidden and _is_pruned(entry.name))
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        stack.append(entry.path)
+        except OSError as e:
+            if current == root:
+                raise
+            warnings.append(f"skipping unreadable directory: {current} ({e.strerror})")
+    return found, warnings
+
+
+def _resolve_dir(
+    raw: str,
+    path: Path,
+    recursive: bool,
+    skip_hidden: bool,
+) -> Result[_Found, str]:
+    """Resolve a directory into naturally sorted candidates."""
+    # Decorate-sort-undecorate on plain strings: each key is built once, the
+    # sort compares keys only, and Path objects are built for the survivors.
+    root = os.fspath(path)
+    try:
+        entries, warnings = _scandir_pdfs(root, recursive, skip_hidden)
+    except OSError as e:
+        return Err(f"cannot read directory: {raw} ({e.strerror})")
+
+    keyed = [(_name_key(e.name), e.path, e.is_symlink()) for e in entries]
+    keyed.sort(key=itemgetter(0, 1))
+
+    if not keyed:
+        warnings.append(f"no PDFs found in directory: {raw}")
+
+    return Ok(_Found(
+        candidates=tuple(_Candidate(Path(p), None, root, link) for _, p, link in keyed),
+        warnings=tuple(warnings),
+        linked=any(link for _, _, link in keyed),
     ))
 
 
-def _resolve_input(recursive: bool, raw: str) -> Result[CollectResult, str]:
-    """Resolve a single CLI input (file or directory) into a CollectResult."""
-    path = Path(raw).resolve()
-    if not path.exists():
+def _resolve_input(recursive: bool, skip_hidden: bool, raw: str) -> Result[_Found, str]:
+    """Resolve a single CLI input (file or directory) into candidates."""
+    # absolute() only prepends the cwd: no syscalls, unlike resolve(), and
+    # no "..", unlike abspath(), which would collapse it across symlinks.
+    path = Path(raw).absolute()
+    # One stat() answers exists / is_file / is_dir.
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         return Err(f"path not found: {raw}")
-    if path.is_file():
+    except OSError as e:
+        return Err(f"cannot access path: {raw} ({e.strerror})")
+    if stat.S_ISREG(mode):
         return _resolve_file(raw, path)
-    if path.is_dir():
-        return _resolve_dir(raw, path, recursive)
+    if stat.S_ISDIR(mode):
+        return _resolve_dir(raw, path, recursive, skip_hidden)
     return Err(f"unsupported path type: {raw}")
 
 
-def _merge_collect_results(a: CollectResult, b: CollectResult) -> CollectResult:
-    """Monoid-like merge of two CollectResults."""
-    return CollectResult(
-        files=(*a.files, *b.files),
-        warnings=(*a.warnings, *b.warnings),
-    )
+def _dedupe_key(c: _Candidate, real_roots: dict[str, str]) -> str:
+    """Symlink-free path of a candidate, without a realpath() per file.
+
+    Each walk root is resolved once. The walk never enters symlinked
+    directories, so below a root only a file that is itself a link needs
+    its own realpath(); every other key is the resolved root plus the
+    path relative to the root.
+    """
+    if c.root is None or c.linked:
+        return os.path.realpath(c.path)
+    real_root = real_roots.get(c.root)
+    if real_root is None:
+        # Strip a trailing separator so "/" and "C:\\" splice like any other root.
+        real_root = real_roots[c.root] = os.path.realpath(c.root).rstrip(os.sep)
+    return real_root + os.fspath(c.path)[len(c.root.rstrip(os.sep)):]
+
+
+def _dedupe(candidates: list[_Candidate]) -> tuple[list[_Candidate], list[str]]:
+    """Drop files already collected under another path, keeping first-seen order.
+
+    A dropped explicit input hands its source to the kept copy, so its
+    failure stays fatal whichever order the inputs came in.
+    """
+    real_roots: dict[str, str] = {}
+    seen: dict[str, int] = {}
+    kept: list[_Candidate] = []
+    warnings: list[str] = []
+    for c in candidates:
+        key = _dedupe_key(c, real_roots)
+        i = seen.get(key)
+        if i is None:
+            seen[key] = len(kept)
+            kept.append(c)
+            continue
+        warnings.append(f"skipping duplicate input: {c.path}")
+        if c.source is not None and kept[i].source is None:
+            kept[i] = replace(kept[i], source=c.source)
+    return kept, warnings
+
+
+def _validate_all(
+    candidates: list[_Candidate],
+    warnings: list[str],
+) -> Result[CollectResult, str]:
+    """Validate all candidates in one pass.
+
+    Probes are read-bound, so they run on a thread pool; map() keeps input
+    order. Explicit files that fail are fatal; directory files only warn.
+    """
+    paths = [c.path for c in candidates]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(paths))) as pool:
+            results = list(pool.map(validate_pdf, paths))
+    else:
+        results = list(map(validate_pdf, paths))
+
+    files: list[Path] = []
+    skippable: list[Path] = []
+    warnings = list(warnings)
+    for c, r in zip(candidates, results):
+        match r:
+            case Ok(p):
+                files.append(p)
+                if c.source is None:
+                    skippable.append(p)
+            case Err(e) if c.source is not None:
+                return Err(f"cannot read PDF: {c.source} ({e})")
+            case Err(e):
+                warnings.append(e)
+
+    return Ok(CollectResult(
+        files=tuple(files),
+        warnings=tuple(warnings),
+        skippable=frozenset(skippable),
+    ))
 
 
-_EMPTY = CollectResult(files=(), warnings=())
+def _require_files(cr: CollectResult) -> Result[CollectResult, str]:
+    return Err("no PDF files to merge") if not cr.files else Ok(cr)
 
 
-def collect_pdfs(inputs: list[str], recursive: bool = False) -> Result[CollectResult, str]:
+def collect_pdfs(
+    inputs: list[str],
+    recursive: bool = False,
+    validate: bool = True,
+    skip_hidden: bool = False,
+) -> Result[CollectResult, str]:
     """Collect PDFs from inputs. Returns Ok(CollectResult) or Err(message).
 
-    Uses fold (reduce) to accumulate results monadically.
-    Short-circuits on the first fatal error (explicit file that fails).
+    Runs in two passes: gather candidate paths from every input, then
+    validate them all at once. Fatal errors (missing path, non-PDF file,
+    unreadable explicit file) short-circuit. A file reached more than once,
+    through overlapping inputs or symlinks, is kept once, with a warning.
+    With validate=False, files are only checked for a .pdf suffix.
+    With skip_hidden=True, recursive walks skip hidden directories and
+    __pycache__.
     """
-    resolve = partial(_resolve_input, recursive)
-
-    def accumulate(
-        acc: Result[CollectResult, str],
-        raw: str,
-    ) -> Result[CollectResult, str]:
-        return acc.bind(
-            lambda prev: resolve(raw).map(
-                lambda curr: _merge_collect_results(prev, curr)
-            )
-        )
-
-    return reduce(accumulate, inputs, Ok(_EMPTY)).bind(
-        lambda cr: Err("no PDF files to merge") if not cr.files else Ok(cr)
-    )
+    resolve = partial(_resolve_input, recursive, skip_hidden)
+
+    candidates: list[_Candidate] = []
+    warnings: list[str] = []
+    linked = False
+    for raw in inputs:
+        match resolve(raw):
+            case Err() as err:
+                return err
+            case Ok(found):
+                candidates.extend(found.candidates)
+                warnings.extend(found.warnings)
+                linked = linked or found.linked
+
+    # The same rule for any number of inputs, so adding an unrelated input
+    # never changes what a directory contributes. The common case, a single
+    # input with no symlinked files, cannot repeat a file and skips the
+    # key work entirely.
+    if len(candidates) > 1 and (len(inputs) > 1 or linked):
+        candidates, duplicates = _dedupe(candidates)
+        warnings.extend(duplicates)
+
+    if not validate:
+        return _require_files(CollectResult(
+            files=tuple(c.path for c in candidates),
+            warnings=tuple(warnings),
+            skippable=frozenset(c.path for c in candidates if c.source is None),
+        ))
+
+    return _validate_all(candidates, warnings).bind(_require_files)
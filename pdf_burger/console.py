@@ -22,15 +22,23 @@ class Console:
     rich: RichConsole
 
 
+_WARNING_PREFIX = "[yellow]warning:[/yellow] "
+_ERROR_PREFIX = "[red bold]error:[/red bold] "
+
+
 def create_console(verbose: bool = False) -> Console:
-    """Create an immutable Console with bound output functions."""
+    """Create an immutable Console with bound output functions.
+
+    Whole-line colours go through style= rather than wrapping the message
+    in markup tags; prefixes are constants joined by concatenation.
+    """
     rich = RichConsole(stderr=True, highlight=False)
 
     return Console(
-        info=lambda msg: rich.print(msg),
-        verbose=(lambda msg: rich.print(f"[dim]{msg}[/dim]")) if verbose else lambda _: None,
-        warning=lambda msg: rich.print(f"[yellow]warning:[/yellow] {msg}"),
-        error=lambda msg: rich.print(f"[red bold]error:[/red bold] {msg}"),
-        success=lambda msg: rich.print(f"[green]{msg}[/green]"),
+        info=rich.print,
+        verbose=(lambda msg: rich.print(msg, style="dim")) if verbose else lambda _: None,
+        warning=lambda msg: rich.print(_WARNING_PREFIX + msg),
+        error=lambda msg: rich.print(_ERROR_PREFIX + msg),
+        success=lambda msg: rich.print(msg, style="green"),
         rich=rich,
     )
@@ -5,11 +5,20 @@ Returns IO[Result[MergeResult, str]] — side effects are lazy until .run().
 
 from __future__ import annotations
 
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import reduce
+from functools import partial
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO, Callable
 
-from pypdf import PdfWriter
+from pypdf import PdfReader, PdfWriter
 from rich.console import Console as RichConsole
 from rich.progress import (
     BarColumn,
@@ -19,9 +28,32 @@ from rich.progress import (
     TextColumn,
 )
 
-from pdf_burger.monads import Err, IO, Ok, Result
+from pdf_burger.monads import Err, IO, Ok, Result, safe
 
 PROGRESS_THRESHOLD = 5
+TREE_MERGE_GROUPS = 8
+
+# pypdf is pure Python, so parsing on threads only pays off when the
+# interpreter runs without the GIL. With it, the two-level merge is about
+# 1.5-2x slower than a single writer, and read-ahead makes an 80-file merge
+# 5-10% slower than reading each input in turn, so both are off.
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Threads parsing upcoming inputs during a merge; 0 reads them in turn.
+MAX_READ_WORKERS = 8 if _FREE_THREADED else 0
+
+# Input count above which the tree merge is used; None disables it.
+TREE_MERGE_THRESHOLD = 64 if _FREE_THREADED else None
+
+# Built once and shared by every Progress. None of these columns sets
+# max_refresh, so their per-task render cache is never read back and
+# reusing them across runs cannot show stale output.
+_PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    MofNCompleteColumn(),
+)
 
 
 @dataclass(frozen=True)
@@ -31,44 +63,213 @@ class MergeResult:
     page_count: int
 
 
-def _append_pdf(writer: PdfWriter, path: Path) -> PdfWriter:
-    """Append a single PDF to the writer. Returns the same writer for chaining."""
-    writer.append(str(path))
-    return writer
+@safe
+def _open_reader(path: Path) -> tuple[BinaryIO, PdfReader]:
+    """Open a PDF and parse its page tree. The caller closes the file.
+
+    Given a path, pypdf would first copy the whole file into a BytesIO; an
+    open file lets it seek and read only what it parses.
+    """
+    fh = open(path, "rb")
+    try:
+        reader = PdfReader(fh)
+        # Walk the page tree here rather than in append().
+        if len(reader.pages) == 0:
+            raise ValueError("PDF has no pages")
+    except BaseException:
+        fh.close()
+        raise
+    return fh, reader
+
+
+type _Opened = Result[tuple[BinaryIO, PdfReader], Exception]
+
+
+def _iter_readers(files: tuple[Path, ...]) -> Iterator[Result[PdfReader, Exception]]:
+    """Yield Ok(reader) or Err(exception) per file, in order.
+
+    Each file is closed once the caller is done with its reader (append()
+    clones every object it needs).
+    """
+    if not MAX_READ_WORKERS:
+        return _read_in_turn(files)
+    return _read_ahead(files)
+
+
+def _yield_opened(opened: _Opened) -> Iterator[Result[PdfReader, Exception]]:
+    match opened:
+        case Ok((fh, reader)):
+            with fh:
+                yield Ok(reader)
+        case Err() as err:
+            yield err
+
+
+def _read_in_turn(files: tuple[Path, ...]) -> Iterator[Result[PdfReader, Exception]]:
+    for f in files:
+        yield from _yield_opened(_open_reader(f))
 
 
-def _build_writer(files: tuple[Path, ...]) -> PdfWriter:
-    """Build a PdfWriter by folding over all input files."""
-    return reduce(_append_pdf, files, PdfWriter())
+def _read_ahead(files: tuple[Path, ...]) -> Iterator[Result[PdfReader, Exception]]:
+    """Like _read_in_turn, but parsed ahead on worker threads.
+
+    Producer/consumer: workers open and parse upcoming files while the
+    caller appends the current one. At most 2 * workers files are open at
+    once.
+    """
+    workers = max(1, min(MAX_READ_WORKERS, len(files)))
+    upcoming = iter(files)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        queue = deque(pool.submit(_open_reader, f) for f in islice(upcoming, 2 * workers))
+        try:
+            while queue:
+                yield from _yield_opened(queue.popleft().result())
+                for f in islice(upcoming, 1):
+                    queue.append(pool.submit(_open_reader, f))
+        finally:
+            for future in queue:
+                if not future.cancel() and future.exception() is None:
+                    match future.result():
+                        case Ok((fh, _)):
+                            fh.close()
+
+
+def _noop() -> None:
+    pass
+
+
+def _fail_unreadable(path: Path, e: Exception) -> None:
+    raise ValueError(f"cannot read PDF: {path} ({e})")
+
+
+def _append_all(
+    writer: PdfWriter,
+    files: tuple[Path, ...],
+    readers: Iterator[Result[PdfReader, Exception]],
+    on_unreadable: Callable[[Path, Exception], None],
+    on_appended: Callable[[], None],
+) -> int:
+    """Append each readable input in order; returns how many were appended.
+
+    on_unreadable decides what a file that failed to parse means: it
+    raises to abort the merge, or returns to skip the file.
+    """
+    appended = 0
+    with closing(readers):
+        for f, opened in zip(files, readers):
+            match opened:
+                case Ok(reader):
+                    writer.append(reader)
+                    appended += 1
+                case Err(e):
+                    on_unreadable(f, e)
+            on_appended()
+    return appended
+
+
+def _build_writer(
+    files: tuple[Path, ...],
+    on_unreadable: Callable[[Path, Exception], None] = _fail_unreadable,
+    on_appended: Callable[[], None] = _noop,
+) -> tuple[PdfWriter, int]:
+    """Build a PdfWriter by appending every input file in order.
+
+    Returns the writer and the number of files appended. on_appended is
+    called once per input file, e.g. to advance a progress bar.
+    """
+    if TREE_MERGE_THRESHOLD is not None and len(files) > TREE_MERGE_THRESHOLD:
+        return _build_writer_tree(files, on_unreadable, on_appended)
+    writer = PdfWriter()
+    appended = _append_all(writer, files, _iter_readers(files), on_unreadable, on_appended)
+    return writer, appended
+
+
+def _merge_group(
+    files: tuple[Path, ...],
+    on_unreadable: Callable[[Path, Exception], None],
+    on_appended: Callable[[], None],
+) -> tuple[BytesIO, int]:
+    """Merge a contiguous slice of the inputs into an in-memory PDF."""
+    writer = PdfWriter()
+    appended = _append_all(writer, files, _read_in_turn(files), on_unreadable, on_appended)
+    buffer = BytesIO()
+    writer.write(buffer)
+    writer.close()
+    buffer.seek(0)
+    return buffer, appended
+
+
+def _build_writer_tree(
+    files: tuple[Path, ...],
+    on_unreadable: Callable[[Path, Exception], None],
+    on_appended: Callable[[], None],
+) -> tuple[PdfWriter, int]:
+    """Two-level merge for very long file lists.
+
+    Splits the inputs into TREE_MERGE_GROUPS contiguous slices, merges each
+    into an in-memory PDF on its own thread, then appends the partial PDFs
+    in order. No single writer's object graph grows with every input, and
+    memory stays bounded by roughly one extra copy of the output.
+    """
+    size = -(-len(files) // TREE_MERGE_GROUPS)
+    groups = [files[i:i + size] for i in range(0, len(files), size)]
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        parts = list(pool.map(lambda g: _merge_group(g, on_unreadable, on_appended), groups))
+    writer = PdfWriter()
+    for part, _ in parts:
+        writer.append(part)
+    return writer, sum(n for _, n in parts)
 
 
 def _build_writer_with_progress(
     files: tuple[Path, ...],
+    on_unreadable: Callable[[Path, Exception], None],
     rich_console: RichConsole,
-) -> PdfWriter:
+) -> tuple[PdfWriter, int]:
     """Build a PdfWriter with a progress bar for large merges."""
-    writer = PdfWriter()
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        console=rich_console,
-        transient=True,
-    ) as progress:
+    with Progress(*_PROGRESS_COLUMNS, console=rich_console, transient=True) as progress:
         task = progress.add_task("merging...", total=len(files))
-        for f in files:
-            _append_pdf(writer, f)
-            progress.update(task, advance=1)
-    return writer
+        return _build_writer(files, on_unreadable, lambda: progress.update(task, advance=1))
 
 
-def _write_and_close(writer: PdfWriter, output: Path) -> MergeResult:
+def _write_and_close(built: tuple[PdfWriter, int], output: Path) -> MergeResult:
     """Write output and return an immutable result. Pure after the IO boundary."""
-    writer.write(str(output))
+    writer, file_count = built
+    if file_count == 0:
+        writer.close()
+        raise ValueError("no readable PDF files")
+    writer.write(os.fspath(output))
     page_count = len(writer.pages)
     writer.close()
-    return MergeResult(output=output, file_count=len(list(writer.pages)) or page_count, page_count=page_count)
+    return MergeResult(output=output, file_count=file_count, page_count=page_count)
+
+
+def _merge_bare(
+    files: tuple[Path, ...],
+    output: Path,
+    on_unreadable: Callable[[Path, Exception], None],
+    on_verbose: Callable[[str], None],
+) -> MergeResult:
+    """Merge without a progress bar, listing the inputs up front."""
+    # One call (and one console write) for the whole list.
+    on_verbose("\n".join(f"  adding: {f.name}" for f in files))
+    return _write_and_close(_build_writer(files, on_unreadable), output)
+
+
+def _merge_progress(
+    files: tuple[Path, ...],
+    output: Path,
+    on_unreadable: Callable[[Path, Exception], None],
+    rich_console: RichConsole,
+) -> MergeResult:
+    """Merge behind a transient progress bar."""
+    return _write_and_close(
+        _build_writer_with_progress(files, on_unreadable, rich_console), output,
+    )
+
+
+def _merge_failed(e: Exception) -> str:
+    return f"merge failed: {e}"
 
 
 def merge_pdfs(
@@ -76,34 +277,34 @@ def merge_pdfs(
     output: Path,
     on_verbose: callable = lambda _: None,
     rich_console: RichConsole | None = None,
+    skippable: frozenset[Path] = frozenset(),
+    on_warning: Callable[[str], None] = lambda _: None,
 ) -> IO[Result[MergeResult, str]]:
-    """Create a lazy IO action that merges PDFs when .run() is called."""
+    """Create a lazy IO action that merges PDFs when .run() is called.
 
-    def effect() -> Result[MergeResult, str]:
-        try:
-            if not output.parent.exists():
-                on_verbose(f"  creating directory: {output.parent}")
-                output.parent.mkdir(parents=True, exist_ok=True)
-
-            use_progress = len(files) > PROGRESS_THRESHOLD and rich_console is not None
-
-            if use_progress:
-                writer = _build_writer_with_progress(files, rich_console)
-            else:
-                for f in files:
-                    on_verbose(f"  adding: {f.name}")
-                writer = _build_writer(files)
-
-            writer.write(str(output))
-            page_count = len(writer.pages)
-            writer.close()
-
-            return Ok(MergeResult(
-                output=output,
-                file_count=len(files),
-                page_count=page_count,
-            ))
-        except Exception as e:
-            return Err(f"merge failed: {e}")
-
-    return IO(effect)
+    A file that fails to parse aborts the merge with its path in the
+    error, unless it is in skippable (found in a directory): those are
+    dropped with a warning and left out of file_count.
+    """
+    def on_unreadable(path: Path, e: Exception) -> None:
+        if path not in skippable:
+            _fail_unreadable(path, e)
+        on_warning(f"skipping unreadable PDF: {path} ({e})")
+
+    # The shape of the merge is fixed by the arguments, so pick the
+    # specialised variant once here instead of branching inside the effect.
+    merge = (
+        partial(_merge_progress, files, output, on_unreadable, rich_console)
+        if len(files) > PROGRESS_THRESHOLD and rich_console is not None
+        else partial(_merge_bare, files, output, on_unreadable, on_verbose)
+    )
+
+    @safe
+    def effect() -> MergeResult:
+        if not output.parent.exists():
+            on_verbose(f"  creating directory: {output.parent}")
+            output.parent.mkdir(parents=True, exist_ok=True)
+
+        return merge()
+
+    return IO(effect).map(lambda r: r.map_err(_merge_failed))
@@ -6,8 +6,8 @@ Provides Result (Either), IO, and combinators — no external dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
-from typing import Callable, Generic, TypeVar, overload
+from functools import reduce, wraps
+from typing import Callable, Generic, Iterable, TypeVar, overload
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -17,7 +17,7 @@ E = TypeVar("E")
 # ── Result monad (Either) ──────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ok(Generic[T]):
     value: T
 
@@ -43,7 +43,7 @@ class Ok(Generic[T]):
         return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Err(Generic[E]):
     error: E
 
@@ -73,7 +73,12 @@ type Result[T, E] = Ok[T] | Err[E]
 
 
 def safe(f: Callable[..., T]) -> Callable[..., Result[T, Exception]]:
-    """Decorator: wrap exceptions into Err, return values into Ok."""
+    """Decorator: wrap exceptions into Err, return values into Ok.
+
+    Apply it once where the function is defined; the wrapper is built at
+    decoration time, not per call.
+    """
+    @wraps(f)
     def wrapper(*args, **kwargs) -> Result[T, Exception]:
         try:
             return Ok(f(*args, **kwargs))
@@ -87,17 +92,26 @@ def safe(f: Callable[..., T]) -> Callable[..., Result[T, Exception]]:
 
 @dataclass(frozen=True)
 class IO(Generic[T]):
-    """Lazy IO action. The effect runs only when .run() is called."""
+    """Lazy IO action. The effect runs only when .run() is called.
+
+    map and bind append to a flat tuple of steps instead of wrapping the
+    effect in another closure, so run() is a loop and a long chain needs
+    no extra stack depth.
+    """
     _effect: Callable[[], T]
+    _steps: tuple[Callable, ...] = ()
 
     def run(self) -> T:
-        return self._effect()
+        value = self._effect()
+        for step in self._steps:
+            value = step(value)
+        return value
 
     def map(self, f: Callable[[T], U]) -> IO[U]:
-        return IO(lambda: f(self.run()))
+        return IO(self._effect, (*self._steps, f))
 
     def bind(self, f: Callable[[T], IO[U]]) -> IO[U]:
-        return IO(lambda: f(self.run()).run())
+        return IO(self._effect, (*self._steps, lambda x: f(x).run()))
 
     @staticmethod
     def pure(value: T) -> IO[T]:
@@ -107,27 +121,49 @@ class IO(Generic[T]):
 # ── Combinators ────────────────────────────────────────────────────
 
 
+def _apply(acc, f: Callable):
+    return f(acc)
+
+
 def pipe(value: T, *fns: Callable) -> T:
     """Thread a value through a sequence of functions left-to-right."""
-    return reduce(lambda acc, f: f(acc), fns, value)
+    return reduce(_apply, fns, value)
+
+
+def sequence(results: Iterable[Result[T, E]]) -> Result[list[T], E]:
+    """Collect Results into a Result of list. Short-circuits on first Err.
+
+    Stops consuming the iterable at the first Err, so lazy inputs are
+    evaluated only as far as needed. Checks the class directly, like
+    partition_results, instead of calling is_err() per element.
+    """
+    values: list[T] = []
+    for r in results:
+        if r.__class__ is Err:
+            return r
+        values.append(r.value)
+    return Ok(values)
 
 
-def sequence(results: list[Result[T, E]]) -> Result[list[T], E]:
-    """Collect a list of Results into a Result of list. Short-circuits on first Err."""
-    return reduce(
-        lambda acc, r: acc.bind(lambda xs: r.map(lambda x: [*xs, x])),
-        results,
-        Ok([]),
-    )
+def traverse(f: Callable[[T], Result[U, E]], items: Iterable[T]) -> Result[list[U], E]:
+    """Map a function over items and sequence the results.
 
+    f is not called on items after the first Err.
+    """
+    return sequence(map(f, items))
 
-def traverse(f: Callable[[T], Result[U, E]], items: list[T]) -> Result[list[U], E]:
-    """Map a function over items and sequence the results."""
-    return sequence(list(map(f, items)))
 
+def partition_results(results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+    """Split results into (successes, failures) without short-circuiting.
 
-def partition_results(results: list[Result[T, E]]) -> tuple[list[T], list[E]]:
-    """Split results into (successes, failures) without short-circuiting."""
-    oks = [r.value for r in results if r.is_ok()]
-    errs = [r.error for r in results if r.is_err()]
+    One pass, so any iterable works; dispatches on the class directly
+    rather than calling is_ok() per element.
+    """
+    oks: list[T] = []
+    errs: list[E] = []
+    for r in results:
+        if r.__class__ is Ok:
+            oks.append(r.value)
+        else:
+            errs.append(r.error)
     return oks, errs
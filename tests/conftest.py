@@ -1,22 +1,35 @@
 """Shared test fixtures."""
 
+import io
+
 import pytest
 from pathlib import Path
 from pypdf import PdfWriter
 
 
+def _build_blank_pdf(text: str | None = None) -> bytes:
+    """Serialize a minimal one-page PDF, optionally titled for identification."""
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    if text:
+        # Add metadata so we can identify the source
+        writer.add_metadata({"/Title": text})
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    writer.close()
+    return buffer.getvalue()
+
+
+# Untitled PDFs are all identical, so they are serialized once per session.
+_BLANK_PDF = _build_blank_pdf()
+
+
 @pytest.fixture
 def make_pdf(tmp_path: Path):
     """Factory fixture that creates a minimal PDF with a given label."""
     def _make(name: str, directory: Path | None = None, text: str | None = None) -> Path:
         dest = (directory or tmp_path) / name
         dest.parent.mkdir(parents=True, exist_ok=True)
-        writer = PdfWriter()
-        writer.add_blank_page(width=72, height=72)
-        if text:
-            # Add metadata so we can identify the source
-            writer.add_metadata({"/Title": text})
-        writer.write(str(dest))
-        writer.close()
+        dest.write_bytes(_build_blank_pdf(text) if text else _BLANK_PDF)
         return dest
     return _make
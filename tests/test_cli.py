@@ -1,10 +1,14 @@
 """Tests for pdf_burger.cli."""
 
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
 from pypdf import PdfReader
 
+from pdf_burger import cli
 from pdf_burger.cli import main
 
 
@@ -26,6 +30,15 @@ class TestCli:
         rc = main([str(a), "-o", str(output)])
         assert rc == 1
 
+    def test_output_exists_checked_before_inputs(self, tmp_path, capsys):
+        output = tmp_path / "out.pdf"
+        output.write_text("dummy")
+        rc = main(["/nonexistent.pdf", "-o", str(output)])
+        assert rc == 1
+        err = capsys.readouterr().err
+        assert "already exists" in err
+        assert "path not found" not in err
+
     def test_output_already_exists_with_overwrite(self, make_pdf, tmp_path):
         a = make_pdf("a.pdf")
         output = tmp_path / "out.pdf"
@@ -41,6 +54,17 @@ class TestCli:
         assert rc == 0
         assert not output.exists()
 
+    def test_dry_run_lists_unreadable_pdf(self, tmp_path, capsys, monkeypatch):
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        output = tmp_path / "out.pdf"
+        monkeypatch.chdir(tmp_path)
+        rc = main(["bad.pdf", "-o", str(output), "--dry-run"])
+        assert rc == 0
+        listing = capsys.readouterr().err
+        assert "target files (1):" in listing
+        assert "bad.pdf" in listing
+
     def test_nonexistent_input(self, tmp_path):
         output = tmp_path / "out.pdf"
         rc = main(["/nonexistent.pdf", "-o", str(output)])
@@ -57,6 +81,16 @@ class TestCli:
         reader = PdfReader(str(output))
         assert len(reader.pages) == 2
 
+    def test_directory_pdf_with_broken_body_is_skipped(self, make_pdf, tmp_path, capsys):
+        d = tmp_path / "docs"
+        make_pdf("1.pdf", directory=d)
+        (d / "2.pdf").write_bytes(b"%PDF-1.4\ngarbage\n%%EOF\n")
+        output = tmp_path / "out.pdf"
+        rc = main([str(d), "-o", str(output)])
+        assert rc == 0
+        assert len(PdfReader(str(output)).pages) == 1
+        assert "skipping unreadable PDF" in capsys.readouterr().err
+
     def test_recursive_flag(self, make_pdf, tmp_path):
         d = tmp_path / "top"
         d.mkdir()
@@ -83,12 +117,25 @@ class TestCli:
         reader = PdfReader(str(output))
         assert len(reader.pages) == 2
 
+    def test_skip_hidden_flag(self, make_pdf, tmp_path):
+        d = tmp_path / "top"
+        make_pdf("a.pdf", directory=d)
+        make_pdf("b.pdf", directory=d / ".archive")
+        output = tmp_path / "out.pdf"
+        rc = main([str(d), "-o", str(output), "-r", "--skip-hidden"])
+        assert rc == 0
+        reader = PdfReader(str(output))
+        assert len(reader.pages) == 1
+
     def test_verbose_flag(self, make_pdf, tmp_path):
         a = make_pdf("a.pdf")
         output = tmp_path / "out.pdf"
         rc = main([str(a), "-o", str(output), "--verbose"])
         assert rc == 0
 
+    def test_repeated_calls_share_parser(self):
+        assert cli._build_parser() is cli._build_parser()
+
     def test_version_flag(self):
         with pytest.raises(SystemExit) as exc_info:
             main(["--version"])
@@ -110,6 +157,24 @@ class TestCli:
         assert rc == 0
         assert (tmp_path / "merged_001.pdf").exists()
 
+    def test_output_auto_unique_skips_taken_names(self, make_pdf, tmp_path, monkeypatch):
+        a = make_pdf("a.pdf")
+        monkeypatch.chdir(tmp_path)
+        for name in ("merged.pdf", "merged_001.pdf", "merged_002.pdf"):
+            (tmp_path / name).write_text("dummy")
+        rc = main([str(a)])
+        assert rc == 0
+        assert (tmp_path / "merged_003.pdf").exists()
+
+    def test_output_auto_unique_ignores_case_variants(self, make_pdf, tmp_path, monkeypatch):
+        a = make_pdf("a.pdf")
+        monkeypatch.chdir(tmp_path)
+        for name in ("merged.pdf", "MERGED_001.PDF"):
+            (tmp_path / name).write_text("dummy")
+        rc = main([str(a)])
+        assert rc == 0
+        assert (tmp_path / "merged_002.pdf").exists()
+
     def test_single_dir_output_name(self, make_pdf, tmp_path, monkeypatch):
         d = tmp_path / "invoices"
         d.mkdir()
@@ -118,3 +183,20 @@ class TestCli:
         rc = main([str(d)])
         assert rc == 0
         assert (tmp_path / "invoices.pdf").exists()
+
+    def test_import_does_not_load_pypdf(self):
+        code = "import sys, pdf_burger.cli; sys.exit('pypdf' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_version_does_not_load_dependencies(self):
+        code = (
+            "import sys\n"
+            "from pdf_burger.cli import main\n"
+            "try:\n"
+            "    main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.exit(any(m in sys.modules for m in ('pypdf', 'rich')))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        assert proc.returncode == 0
@@ -1,8 +1,11 @@
 """Tests for pdf_burger.collector."""
 
+import os
 from pathlib import Path
 
-from pdf_burger.collector import CollectResult, collect_pdfs, natural_sort_key
+from pypdf import PdfWriter
+
+from pdf_burger.collector import CollectResult, collect_pdfs, natural_sort_key, validate_pdf
 from pdf_burger.monads import Err, Ok
 
 
@@ -17,6 +20,62 @@ class TestNaturalSortKey:
         result = sorted(paths, key=natural_sort_key)
         assert [p.name for p in result] == ["a.pdf", "b.pdf", "c.pdf"]
 
+    def test_non_ascii_digits_are_text(self):
+        paths = [Path("1²2.pdf"), Path("1².pdf"), Path("1.pdf")]
+        result = sorted(paths, key=natural_sort_key)
+        assert [p.name for p in result] == ["1.pdf", "1²2.pdf", "1².pdf"]
+
+    def test_long_digit_runs(self):
+        huge = "9" * 5000
+        names = [f"{huge}.pdf", "010.pdf", "9.pdf", f"00{huge[1:]}.pdf"]
+        result = sorted(names, key=natural_sort_key)
+        assert result == ["9.pdf", "010.pdf", f"00{huge[1:]}.pdf", f"{huge}.pdf"]
+        assert natural_sort_key("007.pdf") == natural_sort_key("7.pdf")
+
+    def test_accepts_bare_names(self):
+        assert natural_sort_key("Part 10.pdf") == natural_sort_key(Path("x/Part 10.pdf"))
+        assert sorted(["10.pdf", "2.pdf"], key=natural_sort_key) == ["2.pdf", "10.pdf"]
+
+
+class TestValidatePdf:
+    def test_valid_pdf(self, make_pdf):
+        pdf = make_pdf("a.pdf")
+        assert validate_pdf(pdf) == Ok(pdf)
+
+    def test_missing_header(self, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"hello %%EOF")
+        result = validate_pdf(bad)
+        assert result.is_err()
+        assert "missing %PDF- header" in result.error
+
+    def test_leading_junk_before_header(self, make_pdf):
+        pdf = make_pdf("a.pdf")
+        pdf.write_bytes(b"\xef\xbb\xbf\r\n" + pdf.read_bytes())
+        assert validate_pdf(pdf) == Ok(pdf)
+
+    def test_truncated_file(self, make_pdf):
+        pdf = make_pdf("a.pdf")
+        pdf.write_bytes(pdf.read_bytes()[:-16])
+        result = validate_pdf(pdf)
+        assert result.is_err()
+        assert "missing %%EOF marker" in result.error
+
+    def test_long_tail_after_eof_marker(self, make_pdf):
+        pdf = make_pdf("a.pdf")
+        pdf.write_bytes(pdf.read_bytes() + b"\0" * 2048)
+        assert validate_pdf(pdf) == Ok(pdf)
+
+    def test_deep_rejects_empty_pdf(self, tmp_path):
+        empty = tmp_path / "empty.pdf"
+        writer = PdfWriter()
+        writer.write(str(empty))
+        writer.close()
+        assert validate_pdf(empty).is_ok()
+        result = validate_pdf(empty, deep=True)
+        assert result.is_err()
+        assert "no pages" in result.error
+
 
 class TestCollectPdfs:
     def test_single_file(self, make_pdf, tmp_path):
@@ -64,11 +123,140 @@ class TestCollectPdfs:
         rec = collect_pdfs([str(d)], recursive=True)
         assert len(rec.unwrap().files) == 2
 
+    def test_directory_extension_case_insensitive(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        d.mkdir()
+        make_pdf("a.PDF", directory=d)
+        make_pdf("b.pdf", directory=d)
+        (d / "notes.txt").write_text("hello")
+        (d / "folder.pdf").mkdir()
+        result = collect_pdfs([str(d)])
+        names = [p.name for p in result.unwrap().files]
+        assert names == ["a.PDF", "b.pdf"]
+
+    def test_duplicate_inputs_collected_once(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        d.mkdir()
+        a = make_pdf("a.pdf", directory=d)
+        make_pdf("b.pdf", directory=d)
+        result = collect_pdfs([str(a), str(d), str(a)])
+        cr = result.unwrap()
+        assert [p.name for p in cr.files] == ["a.pdf", "b.pdf"]
+        assert len(cr.warnings) == 2
+        assert all("duplicate" in w for w in cr.warnings)
+
+    def test_corrupt_explicit_duplicate_stays_fatal(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        make_pdf("a.pdf", directory=d)
+        bad = d / "bad.pdf"
+        bad.write_text("not a pdf")
+        for inputs in ([str(d), str(bad)], [str(bad), str(d)]):
+            result = collect_pdfs(inputs)
+            assert result.is_err()
+            assert "cannot read PDF" in result.error
+
+    def test_duplicates_through_symlinks_collected_once(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        a = make_pdf("a.pdf", directory=d)
+        alias = tmp_path / "alias"
+        alias.symlink_to(d, target_is_directory=True)
+        (d / "link.pdf").symlink_to(a)
+        other = make_pdf("other.pdf")
+        alone = collect_pdfs([str(d)]).unwrap()
+        assert [p.name for p in alone.files] == ["a.pdf"]
+        assert len(alone.warnings) == 1
+        with_other = collect_pdfs([str(d), str(other)]).unwrap()
+        assert [p.name for p in with_other.files] == ["a.pdf", "other.pdf"]
+        assert len(with_other.warnings) == 1
+        aliased = collect_pdfs([str(d), str(alias)]).unwrap()
+        assert [p.name for p in aliased.files] == ["a.pdf"]
+        assert len(aliased.warnings) == 3
+
+    def test_recursive_skips_hidden_directories(self, make_pdf, tmp_path):
+        d = tmp_path / "top"
+        make_pdf("a.pdf", directory=d)
+        make_pdf("b.pdf", directory=d / ".git")
+        make_pdf("c.pdf", directory=d / "__pycache__")
+        make_pdf(".d.pdf", directory=d / "nested")
+        result = collect_pdfs([str(d)], recursive=True, skip_hidden=True)
+        names = [p.name for p in result.unwrap().files]
+        assert names == [".d.pdf", "a.pdf"]
+
+    def test_recursive_includes_hidden_directories_by_default(self, make_pdf, tmp_path):
+        d = tmp_path / "top"
+        make_pdf("a.pdf", directory=d)
+        make_pdf("b.pdf", directory=d / ".archive")
+        result = collect_pdfs([str(d)], recursive=True)
+        names = [p.name for p in result.unwrap().files]
+        assert names == ["a.pdf", "b.pdf"]
+
+    def test_recursive_sorted_by_name(self, make_pdf, tmp_path):
+        d = tmp_path / "top"
+        make_pdf("10.pdf", directory=d)
+        make_pdf("2.pdf", directory=d / "b")
+        make_pdf("1.pdf", directory=d / "a")
+        result = collect_pdfs([str(d)], recursive=True)
+        names = [p.name for p in result.unwrap().files]
+        assert names == ["1.pdf", "2.pdf", "10.pdf"]
+
+    def test_recursive_same_names_ordered_by_path(self, make_pdf, tmp_path):
+        d = tmp_path / "top"
+        subs = [f"ch{i:02d}" for i in range(1, 13)]
+        for sub in subs:
+            make_pdf("01.pdf", directory=d / sub)
+        result = collect_pdfs([str(d)], recursive=True)
+        dirs = [p.parent.name for p in result.unwrap().files]
+        assert dirs == subs
+
     def test_nonexistent_path_returns_err(self):
         result = collect_pdfs(["/nonexistent/path.pdf"])
         assert result.is_err()
         assert "path not found" in result.error
 
+    def test_path_under_a_file_returns_err(self, make_pdf):
+        pdf = make_pdf("a.pdf")
+        result = collect_pdfs([str(pdf / "b.pdf")])
+        assert result.is_err()
+        assert "path not found" in result.error
+
+    def test_unreadable_subdirectory_becomes_warning(self, make_pdf, tmp_path, monkeypatch):
+        d = tmp_path / "top"
+        make_pdf("a.pdf", directory=d)
+        make_pdf("b.pdf", directory=d / "locked")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        cr = collect_pdfs([str(d)], recursive=True).unwrap()
+        assert [p.name for p in cr.files] == ["a.pdf"]
+        assert len(cr.warnings) == 1
+        assert "unreadable directory" in cr.warnings[0]
+
+    def test_unreadable_root_returns_err(self, make_pdf, tmp_path, monkeypatch):
+        d = tmp_path / "top"
+        make_pdf("a.pdf", directory=d)
+
+        def scandir(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        result = collect_pdfs([str(d)])
+        assert result.is_err()
+        assert "cannot read directory" in result.error
+
+    def test_dotdot_after_symlink_follows_the_link(self, make_pdf, tmp_path):
+        real = make_pdf("x.pdf", directory=tmp_path / "real")
+        (real.parent / "sub").mkdir()
+        make_pdf("x.pdf", directory=tmp_path / "other")
+        (tmp_path / "other" / "link").symlink_to(real.parent / "sub")
+        result = collect_pdfs([str(tmp_path / "other" / "link" / ".." / "x.pdf")])
+        (found,) = result.unwrap().files
+        assert found.samefile(real)
+
     def test_non_pdf_file_returns_err(self, tmp_path):
         txt = tmp_path / "note.txt"
         txt.write_text("hello")
@@ -96,6 +284,15 @@ class TestCollectPdfs:
         assert result.is_err()
         assert "cannot read PDF" in result.error
 
+    def test_corrupt_explicit_file_among_inputs_returns_err(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        make_pdf("x.pdf", directory=d)
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        result = collect_pdfs([str(d), str(bad)])
+        assert result.is_err()
+        assert result.error.startswith(f"cannot read PDF: {bad}")
+
     def test_corrupt_file_in_dir_becomes_warning(self, make_pdf, tmp_path):
         d = tmp_path / "docs"
         d.mkdir()
@@ -109,6 +306,23 @@ class TestCollectPdfs:
         assert cr.files[0].name == "good.pdf"
         assert len(cr.warnings) == 1
 
+    def test_validate_false_skips_pdf_parsing(self, make_pdf, tmp_path):
+        d = tmp_path / "docs"
+        d.mkdir()
+        make_pdf("good.pdf", directory=d)
+        (d / "bad.pdf").write_text("not a pdf")
+        result = collect_pdfs([str(d)], validate=False)
+        cr = result.unwrap()
+        assert [p.name for p in cr.files] == ["bad.pdf", "good.pdf"]
+        assert cr.warnings == ()
+
+    def test_validate_false_still_checks_suffix(self, tmp_path):
+        txt = tmp_path / "note.txt"
+        txt.write_text("hello")
+        result = collect_pdfs([str(txt)], validate=False)
+        assert result.is_err()
+        assert "not a PDF file" in result.error
+
 
 class TestResultMonad:
     """Verify monadic properties of collect_pdfs results."""
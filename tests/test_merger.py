@@ -1,12 +1,29 @@
 """Tests for pdf_burger.merger."""
 
+from io import StringIO
 from pathlib import Path
 
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, NameObject
+from rich.console import Console as RichConsole
 
+from pdf_burger import merger
 from pdf_burger.merger import MergeResult, merge_pdfs
 
 
+def _sized_pdfs(directory: Path, count: int) -> tuple[Path, ...]:
+    """One-page PDFs whose page width (10, 20, ...) identifies their position."""
+    files = []
+    for i in range(1, count + 1):
+        path = directory / f"{i}.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(width=10 * i, height=72)
+        writer.write(str(path))
+        writer.close()
+        files.append(path)
+    return tuple(files)
+
+
 class TestMergePdfs:
     def test_merge_two_files(self, make_pdf, tmp_path):
         a = make_pdf("a.pdf")
@@ -33,6 +50,92 @@ class TestMergePdfs:
         reader = PdfReader(str(output))
         assert len(reader.pages) == 5
 
+    def test_merge_preserves_page_content(self, make_pdf, tmp_path):
+        src = tmp_path / "content.pdf"
+        writer = PdfWriter()
+        page = writer.add_blank_page(width=72, height=72)
+        content = DecodedStreamObject()
+        content.set_data(b"BT /F1 12 Tf 10 10 Td (hello) Tj ET")
+        page[NameObject("/Contents")] = writer._add_object(content)
+        writer.write(str(src))
+        writer.close()
+        output = tmp_path / "out.pdf"
+        merge_pdfs((make_pdf("a.pdf"), src), output).run()
+        reader = PdfReader(str(output))
+        assert b"(hello) Tj" in reader.pages[1].get_contents().get_data()
+
+    def test_merge_many_files_keeps_order(self, tmp_path):
+        files = _sized_pdfs(tmp_path, 20)
+        output = tmp_path / "out.pdf"
+        result = merge_pdfs(files, output).run()
+        assert result.unwrap().page_count == 20
+        widths = [int(p.mediabox.width) for p in PdfReader(str(output)).pages]
+        assert widths == [10 * i for i in range(1, 21)]
+
+    def test_read_ahead_keeps_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(merger, "MAX_READ_WORKERS", 3)
+        files = _sized_pdfs(tmp_path, 20)
+        output = tmp_path / "out.pdf"
+        result = merge_pdfs(files, output).run()
+        assert result.unwrap().page_count == 20
+        widths = [int(p.mediabox.width) for p in PdfReader(str(output)).pages]
+        assert widths == [10 * i for i in range(1, 21)]
+
+    def test_tree_merge_keeps_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(merger, "TREE_MERGE_THRESHOLD", 4)
+        monkeypatch.setattr(merger, "TREE_MERGE_GROUPS", 3)
+        files = _sized_pdfs(tmp_path, 10)
+        output = tmp_path / "out.pdf"
+        result = merge_pdfs(files, output).run()
+        assert result.unwrap().page_count == 10
+        widths = [int(p.mediabox.width) for p in PdfReader(str(output)).pages]
+        assert widths == [10 * i for i in range(1, 11)]
+
+    def test_merge_unreadable_file_returns_err(self, make_pdf, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        files = (make_pdf("a.pdf"), bad, make_pdf("b.pdf"))
+        result = merge_pdfs(files, tmp_path / "out.pdf").run()
+        assert result.is_err()
+        assert result.error.startswith("merge failed: cannot read PDF")
+        assert str(bad) in result.error
+
+    def test_skippable_unreadable_files_are_skipped(self, make_pdf, tmp_path):
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"%PDF-1.4\ngarbage\n%%EOF\n")
+        empty = tmp_path / "empty.pdf"
+        writer = PdfWriter()
+        writer.write(str(empty))
+        writer.close()
+        files = (make_pdf("a.pdf"), broken, empty, make_pdf("b.pdf"))
+        warnings = []
+        result = merge_pdfs(
+            files, tmp_path / "out.pdf",
+            skippable=frozenset({broken, empty}), on_warning=warnings.append,
+        ).run()
+        mr = result.unwrap()
+        assert (mr.file_count, mr.page_count) == (2, 2)
+        assert len(warnings) == 2
+        assert str(broken) in warnings[0]
+        assert "no pages" in warnings[1]
+
+    def test_nothing_readable_returns_err(self, tmp_path):
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"%PDF-1.4\ngarbage\n%%EOF\n")
+        result = merge_pdfs(
+            (broken,), tmp_path / "out.pdf", skippable=frozenset({broken}),
+        ).run()
+        assert result.error == "merge failed: no readable PDF files"
+        assert not (tmp_path / "out.pdf").exists()
+
+    def test_read_ahead_unreadable_file_returns_err(self, make_pdf, tmp_path, monkeypatch):
+        monkeypatch.setattr(merger, "MAX_READ_WORKERS", 2)
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        files = (make_pdf("a.pdf"), bad, *(make_pdf(f"{i}.pdf") for i in range(6)))
+        result = merge_pdfs(files, tmp_path / "out.pdf").run()
+        assert result.error.startswith("merge failed")
+
     def test_merge_creates_output_directory(self, make_pdf, tmp_path):
         a = make_pdf("a.pdf")
         output = tmp_path / "subdir" / "deep" / "out.pdf"
@@ -40,6 +143,23 @@ class TestMergePdfs:
         assert output.exists()
         assert result.unwrap().output == output
 
+    def test_merge_with_progress_bar(self, tmp_path):
+        files = _sized_pdfs(tmp_path, merger.PROGRESS_THRESHOLD + 1)
+        messages = []
+        rich_console = RichConsole(file=StringIO())
+        result = merge_pdfs(
+            files, tmp_path / "out.pdf",
+            on_verbose=messages.append, rich_console=rich_console,
+        ).run()
+        assert result.unwrap().page_count == len(files)
+        assert messages == []  # the progress bar replaces the file list
+
+    def test_verbose_lists_files_in_one_message(self, make_pdf, tmp_path):
+        messages = []
+        files = (make_pdf("a.pdf"), make_pdf("b.pdf"))
+        merge_pdfs(files, tmp_path / "out.pdf", on_verbose=messages.append).run()
+        assert messages == ["  adding: a.pdf\n  adding: b.pdf"]
+
     def test_io_is_lazy(self, make_pdf, tmp_path):
         """IO action should not execute until .run() is called."""
         a = make_pdf("a.pdf")
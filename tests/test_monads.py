@@ -81,6 +81,12 @@ class TestIO:
         io.run()
         assert len(calls) == 1
 
+    def test_long_chain_runs_without_recursion(self):
+        io = IO.pure(0)
+        for _ in range(1000):
+            io = io.map(lambda x: x + 1).bind(lambda x: IO.pure(x * 1))
+        assert io.run() == 1000
+
 
 class TestSafe:
     def test_success(self):
@@ -113,7 +119,22 @@ class TestCombinators:
         result = traverse(lambda x: Err("no") if x == 2 else Ok(x), [1, 2, 3])
         assert result == Err("no")
 
+    def test_traverse_stops_at_first_err(self):
+        seen = []
+
+        def check(x):
+            seen.append(x)
+            return Err(x) if x == 2 else Ok(x)
+
+        assert traverse(check, iter(range(1, 100))) == Err(2)
+        assert seen == [1, 2]
+
     def test_partition_results(self):
         oks, errs = partition_results([Ok(1), Err("a"), Ok(2), Err("b")])
         assert oks == [1, 2]
         assert errs == ["a", "b"]
+
+    def test_partition_results_from_iterator(self):
+        oks, errs = partition_results(iter([Err("a"), Ok(1), Err("b")]))
+        assert oks == [1]
+        assert errs == ["a", "b"]